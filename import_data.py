@@ -22,106 +22,234 @@ import sys
 import shutil
 import argparse
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime
 import hashlib
 import re
+import functools
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 
+# Title part of a filename: optional numeric ordering prefix ("00_", "1_") and .md extension stripped
+_TITLE_RE = re.compile(r'(?:\d+_)?(.*?)(?:\.md)?\Z', re.DOTALL)
 
+# Characters sanitize_filename replaces (/ : null and control chars), and runs of spaces it collapses
+_CTRL_RE = re.compile(r'[/:\x00-\x1f]')
+_SPACES_RE = re.compile(r' +')
+
+# Document metadata.yaml, formatted straight to bytes
+_METADATA_TEMPLATE = b'id: %d\ntitle: "%b"\ncreated: %b\n'
+
+
+# Cached: the same folder and title names recur throughout a tree
+@functools.lru_cache(maxsize=8192)
 def sanitize_filename(name):
     """Sanitize a string for use as a file/directory name (matches Swift PathSanitizer)."""
     # Replace path traversal
     result = name.replace('..', '_')
     # Replace / : null and control chars
-    result = re.sub(r'[/:\x00-\x1f]', '-', result)
+    result = _CTRL_RE.sub('-', result)
     # Collapse multiple spaces
-    result = re.sub(r' +', ' ', result)
+    result = _SPACES_RE.sub(' ', result)
     # Trim whitespace and dots
     result = result.strip().strip('.')
-    # Truncate to 255 bytes
-    while len(result.encode('utf-8')) > 255:
-        result = result[:-1]
+    # Truncate to 255 bytes, dropping a character split by the cut
+    encoded = result.encode('utf-8')
+    if len(encoded) > 255:
+        result = encoded[:255].decode('utf-8', errors='ignore')
     # Fallback
     if not result:
         result = 'Untitled'
     return result
 
 
+@functools.lru_cache(maxsize=8192)
+def clean_title(filename: str) -> str:
+    """
+    Clean up filename to create a nice title.
+    Removes .md extension and common prefixes.
+    """
+    # Remove numeric prefixes like "00_", "01_", "1_", "2_", etc. and the extension in one match
+    name = _TITLE_RE.match(filename).group(1)
+
+    # Replace underscores with spaces
+    name = name.replace('_', ' ')
+
+    # Capitalize words (not str.title(), which also capitalizes after apostrophes: "Don'T")
+    name = ' '.join(map(str.capitalize, name.split()))
+
+    return name
+
+
+def fold_name(name: str) -> str:
+    """
+    Comparison key for a file name, equal for names the file system treats as the same entry
+    (case-insensitive and normalization-insensitive, like APFS).
+    """
+    return unicodedata.normalize('NFD', name).casefold()
+
+
+def iter_md_files(root: str):
+    """
+    Yield a DirEntry for every .md file below root.
+    Uses os.scandir directly so each entry's type (and stat, once fetched) comes from the directory read
+    instead of extra Path objects and syscalls. Symlinked directories are not followed, and unreadable
+    directories are skipped with a warning (like Path.rglob).
+    """
+    stack = [root]
+    while stack:
+        path = stack.pop()
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith('.md') and entry.is_file():
+                        yield entry
+        except PermissionError as e:
+            print(f"    WARNING: skipping unreadable directory {path}: {e}")
+
+
+def isoformat_ns(timestamp_ns: int) -> str:
+    """Local-time ISO 8601 string for a Unix timestamp in nanoseconds (microsecond precision)"""
+    seconds, micros = divmod((timestamp_ns + 500) // 1000, 1_000_000)
+    # One datetime per call; microseconds are appended the way datetime.isoformat() would
+    iso = datetime.fromtimestamp(seconds).isoformat()
+    return f"{iso}.{micros:06d}" if micros else iso
+
+
 class HiDocuImporter:
-    def __init__(self, db_path: str, data_dir: str, db_only: bool = False):
+    # Documents written per batch/transaction; bounds memory and WAL growth on very large imports
+    COMMIT_INTERVAL = 5000
+    # Threads reading and hashing source files; file I/O and hashlib release the GIL
+    READ_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+    # Threads materializing document folders, so the SQLite writer never waits on the file system
+    WRITE_WORKERS = 4
+    # Files between progress lines (per-item output only with verbose)
+    PROGRESS_INTERVAL = 500
+
+    # Batched inserts; ids are reserved up front by next_id()
+    _INSERT_FOLDER_SQL = """
+        INSERT INTO folders (id, parent_id, name, disk_path, transcription_context, categorization_context,
+                           prefer_summary, minimize_before_llm, sort_order, created_at, modified_at)
+        VALUES (?, ?, ?, ?, '', '', 1, 0, 0, ?, ?)
+    """
+    _INSERT_DOC_SQL = """
+        INSERT INTO documents (id, folder_id, title, document_type, disk_path, body_preview,
+                             summary_text, body_hash, summary_hash, prefer_summary,
+                             minimize_before_llm, created_at, modified_at)
+        VALUES (?, ?, ?, 'markdown', ?, ?, '', ?, '', 0, 0, ?, ?)
+    """
+
+    def __init__(self, db_path: str, data_dir: str, db_only: bool = False, unsafe_fast: bool = False,
+                 verbose: bool = False, disk_paths: dict = None):
         self.db_path = db_path
         self.data_dir = Path(data_dir)
+        self._data_dir_str = str(self.data_dir)  # for os.path.join on hot paths
         self.conn = None
+        self._cursor = None  # single cursor reused for every statement
         self.folder_map = {}  # path -> (folder_id, disk_path) mapping
         self.db_only = db_only  # skip file creation, reuse existing files on disk
+        # Source file -> document disk_path; filled when files are created, reused with db_only
+        self.disk_paths = {} if disk_paths is None else disk_paths
+        self.unsafe_fast = unsafe_fast  # disable journaling and syncs entirely (not crash-safe)
+        self.verbose = verbose  # print every folder and document instead of periodic progress
+        self._journal_mode = None  # journal mode found on connect, restored on close
+        self._now = None  # timestamp shared by all folders of an import
+        self._next_folder_id = None  # next folder id, reserved at the start of an import
+        self._next_doc_id = None  # next document id, reserved at the start of an import
+        # Rows queued until the next flush(), and document file writes running in the background
+        self._folder_rows = []
+        self._doc_rows = []
+        self._writer = None  # ThreadPoolExecutor for write_document_files, alive during an import
+        self._pending_writes = []  # futures of this batch's write_document_files calls
+        self._batch_dirs = []  # directories created for the uncommitted batch, removed again on rollback
+        # Document names taken per folder disk path (seeded from disk on first use), and the next
+        # conflict suffix to try per document path, so collisions cost no stat calls
+        self._used_doc_names = {}
+        self._next_suffix = {}
 
     def connect(self):
         """Connect to the SQLite database"""
-        self.conn = sqlite3.connect(self.db_path)
+        # Autocommit mode: transactions are managed explicitly in import_directory
+        self.conn = sqlite3.connect(self.db_path, isolation_level=None, cached_statements=256)
+        self._cursor = self.conn.cursor()
         self.conn.execute("PRAGMA foreign_keys = ON")
 
+        # Bulk-load tuning. Everything but journal_mode is per-connection and ends with it.
+        self._journal_mode = self.conn.execute("PRAGMA journal_mode").fetchone()[0]
+        if self.unsafe_fast:
+            self.conn.execute("PRAGMA journal_mode = OFF")
+            self.conn.execute("PRAGMA synchronous = OFF")
+        else:
+            self.conn.execute("PRAGMA journal_mode = WAL")
+            self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.execute("PRAGMA temp_store = MEMORY")
+        self.conn.execute("PRAGMA cache_size = -65536")  # 64 MB
+        self.conn.execute("PRAGMA mmap_size = 268435456")  # 256 MB
+        self.conn.execute("PRAGMA locking_mode = EXCLUSIVE")
+
     def close(self):
-        """Close database connection"""
+        """Restore the original journal mode and close database connection"""
         if self.conn:
+            if self._journal_mode:
+                current = self.conn.execute("PRAGMA journal_mode").fetchone()[0]
+                if current != self._journal_mode:
+                    self.conn.execute(f"PRAGMA journal_mode = {self._journal_mode}")
+            self.conn.execute("PRAGMA locking_mode = NORMAL")
+            # Close the shared cursor first; its cached statement would keep the file locked
+            self._cursor.close()
             self.conn.close()
 
-    def clean_title(self, filename: str) -> str:
+    def begin(self):
         """
-        Clean up filename to create a nice title.
-        Removes .md extension and common prefixes.
+        Start a write transaction whose foreign keys are checked once at COMMIT rather than per row.
+        IMMEDIATE takes the write lock up front: ids reserved by next_id() can't be taken by another
+        writer, and there is no deferred read-to-write lock upgrade that could fail with SQLITE_BUSY.
         """
-        # Remove extension
-        name = filename.replace('.md', '')
-
-        # Remove numeric prefixes like "00_", "01_", "1_", "2_", etc.
-        parts = name.split('_', 1)
-        if len(parts) > 1 and parts[0].isdigit():
-            name = parts[1]
-
-        # Replace underscores with spaces
-        name = name.replace('_', ' ')
-
-        # Capitalize words
-        name = ' '.join(word.capitalize() for word in name.split())
-
-        return name
+        self._cursor.execute("BEGIN IMMEDIATE")
+        # Resets at every COMMIT, so it has to be set for each transaction
+        self._cursor.execute("PRAGMA defer_foreign_keys = ON")
 
     def create_folder(self, name: str, parent_id: int = None, parent_disk_path: str = "") -> tuple:
-        """Create a folder in the database and file system. Returns (folder_id, disk_path)."""
-        now = datetime.now().isoformat()
+        """
+        Create a folder on disk and queue its database row for the next flush().
+        Returns (folder_id, disk_path).
+        """
+        now = self._now
         sanitized = sanitize_filename(name)
         disk_path = f"{parent_disk_path}/{sanitized}" if parent_disk_path else sanitized
 
         if not self.db_only:
-            folder_dir = self.data_dir / disk_path
-            folder_dir.mkdir(parents=True, exist_ok=True)
-
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT INTO folders (parent_id, name, disk_path, transcription_context, categorization_context,
-                               prefer_summary, minimize_before_llm, sort_order, created_at, modified_at)
-            VALUES (?, ?, ?, '', '', 1, 0, 0, ?, ?)
-        """, (parent_id, name, disk_path, now, now))
-        folder_id = cursor.lastrowid
-        self.conn.commit()
-        print(f"  Created folder: {name} (id={folder_id}, path={disk_path})")
+            # Ancestors are always created first, so a single mkdir suffices (no per-ancestor stats)
+            try:
+                os.mkdir(os.path.join(self._data_dir_str, disk_path))
+                self._batch_dirs.append(disk_path)
+            except FileExistsError:
+                pass
+
+        folder_id = self._next_folder_id
+        self._next_folder_id += 1
+        self._folder_rows.append((folder_id, parent_id, name, disk_path, now, now))
+        if self.verbose:
+            print(f"  Created folder: {name} (id={folder_id}, path={disk_path})")
         return (folder_id, disk_path)
 
-    def get_or_create_folder_hierarchy(self, rel_path: Path) -> tuple:
+    def get_or_create_folder_hierarchy(self, rel_path: str) -> tuple:
         """
-        Get or create folder hierarchy for a path.
+        Get or create folder hierarchy for a relative directory path ("" for the root).
         Returns (folder_id, disk_path) for the deepest folder.
         """
         # Root level - no folder
-        if rel_path == Path('.'):
+        if not rel_path:
             return (None, "")
 
-        parts = rel_path.parts
         parent_id = None
         parent_disk_path = ""
+        path_str = ""
 
-        for i, part in enumerate(parts):
-            current_path = Path(*parts[:i+1])
-            path_str = str(current_path)
+        for part in rel_path.split(os.sep):
+            # Plain string prefix of rel_path; same keys as os.path.dirname() gives for files
+            path_str = f"{path_str}{os.sep}{part}" if path_str else part
 
             if path_str not in self.folder_map:
                 folder_id, disk_path = self.create_folder(part, parent_id, parent_disk_path)
@@ -134,57 +262,168 @@ class HiDocuImporter:
 
         return (parent_id, parent_disk_path)
 
-    def sha256(self, content: str) -> str:
-        """Calculate SHA256 hash of content"""
-        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+    def next_id(self, table: str) -> int:
+        """
+        Next free id for an AUTOINCREMENT table.
+        Honors sqlite_sequence so ids of deleted rows are never reused.
+        Ids are assigned client-side rather than read back per row (lastrowid / RETURNING),
+        which is what lets rows be inserted with executemany: it discards RETURNING results.
+        """
+        row = self._cursor.execute(f"""
+            SELECT MAX(COALESCE((SELECT MAX(id) FROM {table}), 0),
+                       COALESCE((SELECT seq FROM sqlite_sequence WHERE name = ?), 0)) + 1
+        """, (table,)).fetchone()
+        return row[0]
+
+    def sha256(self, content: bytes) -> str:
+        """Calculate SHA256 hash of content (OpenSSL-backed, uses SHA extensions where the CPU has them)"""
+        return hashlib.sha256(content).hexdigest()
 
-    def create_document(self, title: str, folder_id: int, content: str, created_at: datetime, folder_disk_path: str = "") -> int:
-        """Create a document in the database and file system"""
-        now = datetime.now().isoformat()
-        created_iso = created_at.isoformat()
+    def load_file(self, md_file: os.DirEntry) -> tuple:
+        """
+        Read and hash a source file. Runs on the reader thread pool.
+        Returns (md_file, mtime_ns, body_preview, body_hash, error); error is set if the file couldn't be read.
+        Only the preview is kept: the body itself is copied file-to-file when the document is written.
+        """
+        try:
+            with open(md_file.path, 'rb') as f:
+                body = f.read()
+            # Decoding validates UTF-8; preview is 500 characters, like the app's String.prefix(500)
+            body_preview = body.decode('utf-8')[:500]
+        except Exception as e:
+            return (md_file, None, None, None, e)
+        # Hash the bytes as read; no need to re-encode the decoded text
+        return (md_file, md_file.stat().st_mtime_ns, body_preview, self.sha256(body), None)
+
+    def load_files(self, md_files: list):
+        """Yield load_file() results in order, reading up to one batch ahead on a thread pool."""
+        with ThreadPoolExecutor(max_workers=self.READ_WORKERS) as pool:
+            for start in range(0, len(md_files), self.COMMIT_INTERVAL):
+                yield from pool.map(self.load_file, md_files[start:start + self.COMMIT_INTERVAL])
+
+    def create_document(self, title: str, folder_id: int, source_file: str, body_preview: str, body_hash: str,
+                        created_ns: int, folder_disk_path: str = "") -> int:
+        """
+        Queue a document row for the next flush() and start writing its files in the background.
+        Returns the document id.
+        """
+        created_iso = isoformat_ns(created_ns)
 
         # Sanitize title for filesystem
         sanitized = sanitize_filename(title)
         doc_dir_name = f"{sanitized}.document"
         disk_path = f"{folder_disk_path}/{doc_dir_name}" if folder_disk_path else doc_dir_name
 
-        if not self.db_only:
-            # Handle conflicts (only when creating files)
-            counter = 2
-            while (self.data_dir / disk_path).exists():
+        if self.db_only and source_file in self.disk_paths:
+            # Point at the folder the import that created the files chose for this source file
+            disk_path = self.disk_paths[source_file]
+        else:
+            # Handle conflicts. Without a recorded path, db_only falls back to in-memory numbering
+            # ("Cv", "Cv 2", ...), which matches only if the first import started from an empty folder
+            used = self.used_doc_names(folder_disk_path)
+            if fold_name(doc_dir_name) in used:
+                counter = self._next_suffix.get(disk_path, 2)
+                while fold_name(f"{sanitized} {counter}.document") in used:
+                    counter += 1
+                self._next_suffix[disk_path] = counter + 1
                 doc_dir_name = f"{sanitized} {counter}.document"
                 disk_path = f"{folder_disk_path}/{doc_dir_name}" if folder_disk_path else doc_dir_name
-                counter += 1
-
-        # Insert with real disk path directly (no placeholder)
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT INTO documents (folder_id, title, document_type, disk_path, body_preview,
-                                 summary_text, body_hash, summary_hash, prefer_summary,
-                                 minimize_before_llm, created_at, modified_at)
-            VALUES (?, ?, 'markdown', ?, ?, '', ?, '', 0, 0, ?, ?)
-        """, (folder_id, title, disk_path, content[:500], self.sha256(content), created_iso, created_iso))
-        doc_id = cursor.lastrowid
+            used.add(fold_name(doc_dir_name))
+            if not self.db_only:
+                self.disk_paths[source_file] = disk_path
+
+        # Id is assigned up front so the row is written once with its final values
+        doc_id = self._next_doc_id
+        self._next_doc_id += 1
+
+        self._doc_rows.append(
+            (doc_id, folder_id, title, disk_path, body_preview, body_hash, created_iso, created_iso))
+        self._pending_writes.append(
+            self._writer.submit(self.write_document_files, disk_path, doc_id, title, source_file, created_iso))
+
+        if self.verbose:
+            print(f"    Created document: {title} (id={doc_id}, path={disk_path})")
+        return doc_id
+
+    def used_doc_names(self, folder_disk_path: str) -> set:
+        """
+        Return the set of entry names taken in a folder, as fold_name() keys, listing it with one scandir
+        the first time (starting empty with db_only). Names are added as documents are planned, so the
+        set stays current without touching the disk.
+        """
+        used = self._used_doc_names.get(folder_disk_path)
+        if used is None:
+            used = set()
+            if not self.db_only:
+                try:
+                    with os.scandir(os.path.join(self._data_dir_str, folder_disk_path)) as it:
+                        used = {fold_name(entry.name) for entry in it}
+                except FileNotFoundError:
+                    pass
+            self._used_doc_names[folder_disk_path] = used
+        return used
+
+    def write_document_files(self, disk_path: str, doc_id: int, title: str, source_file: str, created_iso: str):
+        """Write a document's folder, body and metadata to the file system. Runs on the writer thread pool."""
+        doc_folder = os.path.join(self._data_dir_str, disk_path)
 
         if not self.db_only:
-            # Create document folder
-            doc_folder = self.data_dir / disk_path
-            doc_folder.mkdir(parents=True, exist_ok=True)
-            (doc_folder / "sources").mkdir(exist_ok=True)
+            # Create document folder. Its parent folder already exists and conflict handling
+            # picked an unused name, so two plain mkdirs suffice (no existence checks)
+            os.mkdir(doc_folder)
+            self._batch_dirs.append(disk_path)
+            os.mkdir(os.path.join(doc_folder, "sources"))
 
-            # Write files
-            (doc_folder / "body.md").write_text(content, encoding='utf-8')
-            (doc_folder / "summary.md").write_text('', encoding='utf-8')
+            # Write files; the body is copied as-is (in-kernel where the OS supports it).
+            # No summary.md: the app treats a missing summary as empty and creates it on first write
+            shutil.copyfile(source_file, os.path.join(doc_folder, "body.md"))
 
         # Write metadata.yaml (always — updates doc id for this DB)
-        doc_folder = self.data_dir / disk_path
         escaped_title = title.replace('"', '\\"')
-        metadata_content = f'id: {doc_id}\ntitle: "{escaped_title}"\ncreated: {created_iso}\n'
-        (doc_folder / "metadata.yaml").write_text(metadata_content, encoding='utf-8')
+        metadata_content = _METADATA_TEMPLATE % (doc_id, escaped_title.encode('utf-8'), created_iso.encode('ascii'))
+        metadata_path = os.path.join(doc_folder, "metadata.yaml")
+        if self.db_only:
+            # Re-imports often assign the same ids; leave an identical file untouched
+            try:
+                with open(metadata_path, 'rb') as f:
+                    if f.read() == metadata_content:
+                        return
+            except FileNotFoundError:
+                pass
+        fd = os.open(metadata_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, metadata_content)
+        finally:
+            os.close(fd)
+
+    def flush(self):
+        """
+        Insert all queued folder and document rows in bulk, then wait for the batch's document files,
+        so nothing is committed before its files are on disk.
+        """
+        if self._folder_rows:
+            self._cursor.executemany(self._INSERT_FOLDER_SQL, self._folder_rows)
+            self._folder_rows = []
+
+        if self._doc_rows:
+            self._cursor.executemany(self._INSERT_DOC_SQL, self._doc_rows)
+            self._doc_rows = []
 
+        for write in self._pending_writes:
+            write.result()  # re-raises a failed write
+        self._pending_writes = []
+
+    def commit(self):
+        """Commit the current batch; its directories are now backed by database rows."""
         self.conn.commit()
-        print(f"    Created document: {title} (id={doc_id}, path={disk_path})")
-        return doc_id
+        self._batch_dirs = []
+
+    def remove_batch_dirs(self):
+        """Delete the directories created for a rolled-back batch, so no folder is left without its row."""
+        # Deepest first; a removed folder takes its documents with it
+        for disk_path in reversed(self._batch_dirs):
+            shutil.rmtree(os.path.join(self._data_dir_str, disk_path), ignore_errors=True)
+        self._batch_dirs = []
 
     def import_directory(self, source_dir: Path):
         """Import all markdown files from source directory"""
@@ -196,8 +435,11 @@ class HiDocuImporter:
         # Ensure data directory exists
         self.data_dir.mkdir(parents=True, exist_ok=True)
 
-        # Find all .md files
-        md_files = sorted(source_dir.rglob("*.md"))
+        # Find all .md files, ordered like sorted Paths (component-wise)
+        root = str(source_dir)
+        prefix_len = len(os.path.join(root, ''))
+        md_files = list(iter_md_files(root))
+        md_files.sort(key=lambda entry: entry.path[prefix_len:].split(os.sep))
 
         if not md_files:
             print(f"No .md files found in {source_dir}")
@@ -205,38 +447,70 @@ class HiDocuImporter:
 
         print(f"\nFound {len(md_files)} markdown files to import\n")
 
-        # Process each file
-        for i, md_file in enumerate(md_files):
-            # Calculate relative path from source directory
-            rel_path = md_file.relative_to(source_dir)
-            folder_path = rel_path.parent
-
-            # Get or create folder hierarchy
-            folder_id, folder_disk_path = self.get_or_create_folder_hierarchy(folder_path)
-
-            # Read content
-            try:
-                content = md_file.read_text(encoding='utf-8')
-            except Exception as e:
-                print(f"    ERROR reading {md_file}: {e}")
-                continue
-
-            # Create document
-            title = self.clean_title(md_file.name)
-
-            # Use file modification time as creation date, offset by index to maintain order
-            file_mtime = datetime.fromtimestamp(md_file.stat().st_mtime)
-            # Subtract index * 1 minute to ensure files sort correctly by creation date
-            created_at = file_mtime - timedelta(minutes=len(md_files) - i)
-
-            self.create_document(title, folder_id, content, created_at, folder_disk_path)
+        # Single explicit transaction instead of one commit (and fsync) per row
+        self._writer = ThreadPoolExecutor(max_workers=self.WRITE_WORKERS)
+        self.begin()
+        try:
+            self._now = datetime.now().isoformat()
+            self._next_folder_id = self.next_id("folders")
+            self._next_doc_id = self.next_id("documents")
+
+            # Create every folder up front (ancestors first, in file order) so each file needs one lookup
+            for folder_path in dict.fromkeys(os.path.dirname(entry.path[prefix_len:]) for entry in md_files):
+                self.get_or_create_folder_hierarchy(folder_path)
+            if self.folder_map:
+                print(f"  Created {len(self.folder_map)} folders")
+
+            # Creation times step back one minute per remaining file (see below)
+            first_offset_ns = len(md_files) * 60_000_000_000
+
+            # Process each file; reads and hashing happen ahead of us on worker threads
+            for i, (md_file, mtime_ns, body_preview, body_hash, error) in enumerate(self.load_files(md_files)):
+                # Folder from the relative path; root-level files have none
+                rel_path = md_file.path[prefix_len:]
+                folder_id, folder_disk_path = self.folder_map.get(os.path.dirname(rel_path), (None, ""))
+
+                if error:
+                    print(f"    ERROR reading {md_file.path}: {error}")
+                else:
+                    # Create document
+                    title = clean_title(md_file.name)
+
+                    # Use file modification time as creation date, offset by index to maintain order
+                    # Subtract index * 1 minute to ensure files sort correctly by creation date
+                    created_ns = mtime_ns - first_offset_ns + i * 60_000_000_000
+
+                    self.create_document(title, folder_id, md_file.path, body_preview, body_hash, created_ns,
+                                         folder_disk_path)
+
+                if not self.verbose and (i + 1) % self.PROGRESS_INTERVAL == 0:
+                    print(f"  {i + 1}/{len(md_files)} files processed", flush=True)
+
+                # Write out the batch and checkpoint so a huge import doesn't grow the WAL unbounded
+                if (i + 1) % self.COMMIT_INTERVAL == 0:
+                    self.flush()
+                    self.commit()
+                    self.begin()
+
+            self.flush()
+            self.commit()
+        except BaseException:
+            # Stop the writers before cleaning up, so no folder appears after the rollback
+            self._writer.shutdown(cancel_futures=True)
+            self.conn.rollback()
+            self.remove_batch_dirs()
+            raise
+        finally:
+            self._writer.shutdown()
+            self._writer = None
 
         print(f"\n✓ Import complete! Imported {len(md_files)} documents")
 
     def clear_database(self):
         """Clear all folders and documents from database"""
         print("\nClearing existing data...")
-        cursor = self.conn.cursor()
+        cursor = self._cursor
+        cursor.execute("BEGIN IMMEDIATE")
         cursor.execute("DELETE FROM transcripts")
         cursor.execute("DELETE FROM sources")
         cursor.execute("DELETE FROM documents")
@@ -341,6 +615,16 @@ def main():
         action='store_true',
         help='Skip confirmation prompts'
     )
+    parser.add_argument(
+        '--verbose', '-v',
+        action='store_true',
+        help='Print every created folder and document'
+    )
+    parser.add_argument(
+        '--unsafe-fast',
+        action='store_true',
+        help='Disable SQLite journaling and syncs during import (a crash can corrupt the database)'
+    )
 
     args = parser.parse_args()
 
@@ -377,6 +661,7 @@ def main():
 
     filesystem_cleared = False
     files_created = False
+    disk_paths = {}  # document folders chosen by the first import, reused by the db_only ones
 
     for label, db_path in db_targets:
         print(f"\n{'─' * 60}")
@@ -384,7 +669,8 @@ def main():
         print(f"{'─' * 60}")
 
         # After the first import creates files, subsequent imports only update the DB
-        importer = HiDocuImporter(db_path, data_dir, db_only=files_created)
+        importer = HiDocuImporter(db_path, data_dir, db_only=files_created, unsafe_fast=args.unsafe_fast,
+                                  verbose=args.verbose, disk_paths=disk_paths)
         try:
             importer.connect()
 
@@ -396,6 +682,12 @@ def main():
 
             importer.import_directory(args.source_dir)
             files_created = True
+        except sqlite3.OperationalError as e:
+            # The importer holds the database exclusively; any other open connection blocks it
+            print(f"\n❌ ERROR importing into {db_path}: {e}")
+            if "locked" in str(e):
+                print("Quit HiDocu (and anything else using this database) and run the import again.")
+            sys.exit(1)
         except Exception as e:
             print(f"\n❌ ERROR importing into {db_path}: {e}")
             import traceback